@@ -2,24 +2,61 @@
 from __future__ import annotations
 
 import asyncio
+import binascii
 import logging
 import struct
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Any, Callable, Mapping, Optional, Tuple
 
 from bleak import BleakClient
+from bleak.backends.device import BLEDevice
 from bleak_retry_connector import BleakNotFoundError, establish_connection
 from homeassistant.components import bluetooth
-
-from .const import CMD_OFF, CMD_ON, DOMAIN, NOTIFY_CHAR, POLL52, WRITE_CHAR
+from homeassistant.components.bluetooth import (
+    BluetoothCallbackMatcher,
+    BluetoothChange,
+    BluetoothScanningMode,
+    BluetoothServiceInfoBleak,
+)
+from homeassistant.core import callback
+
+from .const import (
+    CMD_OFF,
+    CMD_ON,
+    CONF_HEX_LOG_LIMIT,
+    CONF_NO_NOTIFY_RECONNECT,
+    CONF_POLL_WAIT,
+    DOMAIN,
+    NOTIFY_CHAR,
+    POLL52,
+    WRITE_CHAR,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Дефолты ниже можно переопределить через entry.options (см. CONF_* в const.py).
 HEX_LOG_LIMIT = 256
 
 # Если вообще нет нотификаций (ни 8, ни 52) столько времени — тогда reconnect.
 NO_NOTIFY_RECONNECT_SEC = 25.0
 
+# Сколько ждём 52B-ответ на одну запись POLL52.
+POLL_WAIT_SEC = 1.6
+
+# Второй режим записи POLL52 пробуем, только когда текущий промахнулся на столько раз
+# подряд больше него: по умолчанию это noresp, noresp, и лишь затем resp.
+POLL_MODE_SWITCH_MISSES = 2
+
+# Каждый reconnect по "тишине" удваивает порог NO_NOTIFY_RECONNECT_SEC (не больше 2**N раз),
+# чтобы не уйти в горячий цикл переподключений к устройству, которое просто молчит.
+NO_NOTIFY_BACKOFF_MAX_POW = 3
+
+# Сколько секунд переиспользуем найденный BLEDevice при повторных connect() (reconnect-штормы).
+BLE_DEVICE_CACHE_SEC = 5.0
+
+# Таймаут лёгкой GATT-проверки живости линка перед reconnect.
+LINK_PROBE_TIMEOUT_SEC = 1.0
+
 # Сколько секунд после CMD_OFF мы готовы считать "idle notify (8 bytes)" подтверждением выключения
 IDLE_AFTER_OFF_CONFIRM_SEC = 4.0
 
@@ -27,8 +64,36 @@ IDLE_AFTER_OFF_CONFIRM_SEC = 4.0
 # и не продолжаем дожимать 52 (чтобы не тратить время).
 IDLE_NOTIFY_FAST_RETURN_SEC = 1.0
 
+# Бюджеты попыток POLL в poll_status: короткие сначала (ответ обычно в ближайшее
+# connection event), длиннее потом; сверху каждую всё равно режет POLL_WAIT_SEC.
+POLL_ATTEMPT_SLICES_SEC = (0.7, 1.0, 1.5, 2.3)
+
+# Пауза после неудачной попытки: POLL_RETRY_BACKOFF_SEC * 2**(attempt-1).
+POLL_RETRY_BACKOFF_SEC = 0.1
+
+# Столько 52B-кадров подряд пришло без нашей записи — считаем, что устройство пушит статус
+# само, и poll_status сперва просто ждёт push, не отправляя POLL52.
+PUSH_MODE_MIN_CONFIDENCE = 3
 
-@dataclass
+# Какую долю таймаута poll_status ждём push, прежде чем откатиться на POLL52.
+PUSH_WAIT_FRACTION = 0.5
+
+# Сколько set_on ждёт смены is_on от notify, прежде чем самому слать POLL52.
+STATE_CHANGE_WAIT_SEC = 0.5
+
+# Если свежий (не старше стольких секунд) 52B-кадр уже показывает нужное состояние,
+# set_on не шлёт команду вовсе.
+ALREADY_IN_STATE_FRESH_SEC = 5.0
+
+# CRC 52B-кадров начинаем требовать после стольких разных кадров подряд с верной CRC
+# (одно случайное совпадение у прошивки без CRC — шанс 1/65536 — ничего не включает)...
+CRC_ENFORCE_AFTER = 3
+
+# ...и перестаём, если при включённой проверке столько кадров подряд пришло с неверной.
+CRC_RELAX_AFTER = 3
+
+
+@dataclass(slots=True)
 class Parsed:
     is_on: Optional[bool] = None
     room_c: Optional[float] = None
@@ -36,35 +101,47 @@ class Parsed:
     raw52: Optional[bytes] = None
 
 
-def _hex(b: bytes | bytearray | None, limit: int = HEX_LOG_LIMIT) -> str:
+def _hex(b: bytes | bytearray | memoryview | None, limit: int = HEX_LOG_LIMIT) -> str:
     if not b:
         return ""
-    bb = bytes(b)
-    if len(bb) > limit:
-        return bb[:limit].hex().upper() + f"...(+{len(bb) - limit} bytes)"
-    return bb.hex().upper()
+    # .hex() есть у bytes/bytearray/memoryview — копию данных не делаем
+    n = len(b)
+    if n > limit:
+        return memoryview(b)[:limit].hex().upper() + f"...(+{n - limit} bytes)"
+    return b.hex().upper()
+
 
+# Маркер блока состояния в 52B и слово из байт (+4, +5) после него -> is_on.
+_SYNC = b"\xA5\x05"
+_ONOFF_MAP = {0x0173: True, 0x02EF: False}
 
-def _u16le(p: bytes, off: int) -> int:
-    return struct.unpack_from("<H", p, off)[0]
+# Команды питания, индекс — bool(on)
+_CMDS = (CMD_OFF, CMD_ON)
 
+# Температуры: два int16 LE подряд с оффсета 14 (room, heater).
+_TEMPS = struct.Struct("<hh")
 
-def _s16le(p: bytes, off: int) -> int:
-    return struct.unpack_from("<h", p, off)[0]
+# Живые GATT-соединения по адресу (upper): async_can_connect опирается на них,
+# а не ждёт advertisement от уже подключённого (и часто не рекламирующегося) устройства.
+_ACTIVE: dict[str, ProfterHeaterBLE] = {}
 
 
 def parse_onoff_from_status52(p: bytes) -> Optional[bool]:
     if len(p) != 52:
         return None
-
-    for i in range(0, len(p) - 6):
-        if p[i] == 0xA5 and p[i + 1] == 0x05:
-            b1 = p[i + 4]
-            b2 = p[i + 5]
-            if (b1, b2) == (0x01, 0x73):
-                return True
-            if (b1, b2) == (0x02, 0xEF):
-                return False
+    return _onoff_52(p)
+
+
+def _onoff_52(p: bytes) -> Optional[bool]:
+    # без проверки длины: вызывающий гарантирует len(p) == 52
+    # маркер A5 05 ищем через bytes.find (C), а не побайтовым циклом
+    # пару байт после маркера классифицируем одним lookup по 16-битному слову
+    i = p.find(_SYNC)
+    while 0 <= i < 46:
+        on = _ONOFF_MAP.get((p[i + 4] << 8) | p[i + 5])
+        if on is not None:
+            return on
+        i = p.find(_SYNC, i + 1)
     return None
 
 
@@ -72,52 +149,111 @@ def parse_temps_best_effort(p: bytes) -> Tuple[Optional[float], Optional[float]]
     if len(p) != 52:
         return (None, None)
 
-    try:
-        room = _s16le(p, 14) / 10.0
-        heater = _s16le(p, 16) / 10.0
-    except struct.error:
-        return (None, None)
+    return _temps_from_raw(*_TEMPS.unpack_from(p, 14))
 
-    if not (-40.0 <= room <= 80.0):
-        room = None
-    if not (-40.0 <= heater <= 250.0):
-        heater = None
 
+def _temps_from_raw(room_raw: int, heater_raw: int) -> Tuple[Optional[float], Optional[float]]:
+    # диапазоны в десятых °C: room -40..80, heater -40..250; делим только валидные
+    room = room_raw / 10.0 if -400 <= room_raw <= 800 else None
+    heater = heater_raw / 10.0 if -400 <= heater_raw <= 2500 else None
     return (room, heater)
 
 
 async def async_can_connect(hass, address: str) -> tuple[bool, Optional[str]]:
+    active = _ACTIVE.get(address.upper())
+    if active is not None and active.is_connected:
+        return True, None
+
     try:
-        ble_device = bluetooth.async_ble_device_from_address(hass, address, connectable=True)
-        if ble_device is None:
+        # Для проверки достижимости хватает свежего advertisement из кэша HA —
+        # полноценный коннект (с GATT discovery) здесь не делаем.
+        if not bluetooth.async_address_present(hass, address, connectable=True):
             return False, "not_found"
-
-        client = await establish_connection(BleakClient, ble_device, address, max_attempts=2)
-        try:
-            await client.disconnect()
-        except Exception:
-            pass
         return True, None
-
-    except BleakNotFoundError:
-        return False, "not_found"
     except Exception:
         return False, "cannot_connect"
 
 
 class ProfterHeaterBLE:
-    def __init__(self, hass, address: str) -> None:
+    __slots__ = (
+        "_hass",
+        "_address",
+        "_hex_limit",
+        "_no_notify_reconnect_sec",
+        "_poll_wait_sec",
+        "_client",
+        "_ble_device",
+        "_ble_device_ts",
+        "_time",
+        "_lock",
+        "_inflight_poll",
+        "_last",
+        "_parsed_raw52",
+        "_pending_52",
+        "_state_changed",
+        "_preferred_response",
+        "_poll_mode_fails",
+        "_push_confidence",
+        "_last_write_ts",
+        "_crc_enforced",
+        "_crc_good_run",
+        "_crc_bad_run",
+        "_crc_last",
+        "_notify_count",
+        "_silent_reconnects",
+        "_silence_action_ts",
+        "_last_any_notify_ts",
+        "_last_52_ts",
+        "_last_8_ts",
+    )
+
+    def __init__(self, hass, address: str, options: Mapping[str, Any] | None = None) -> None:
         self._hass = hass
         self._address = address
 
+        options = options or {}
+        self._hex_limit = int(options.get(CONF_HEX_LOG_LIMIT, HEX_LOG_LIMIT))
+        self._no_notify_reconnect_sec = float(options.get(CONF_NO_NOTIFY_RECONNECT, NO_NOTIFY_RECONNECT_SEC))
+        self._poll_wait_sec = float(options.get(CONF_POLL_WAIT, POLL_WAIT_SEC))
+
         self._client: BleakClient | None = None
+        self._ble_device: BLEDevice | None = None
+        self._ble_device_ts = 0.0
+        self._time: Callable[[], float] | None = None
         self._lock = asyncio.Lock()
+        self._inflight_poll: asyncio.Future | None = None
 
         self._last = Parsed()
-        self._evt_52 = asyncio.Event()
+        # кадр, из которого разобран текущий _last; None — is_on переписан set_on (оптимистично
+        # или по 8B idle), и следующий 52B надо разобрать заново, даже если он совпал с raw52
+        self._parsed_raw52: Optional[bytes] = None
+        # одноразовый future текущего POLL52: резолвит первый 52B notify после записи
+        self._pending_52: asyncio.Future | None = None
+        # взводится в _parse_52, когда is_on реально поменялся
+        self._state_changed = asyncio.Event()
+
+        # какой режим записи POLL52 (response=True/False) последним дал 52B на этом коннекте
+        self._preferred_response: Optional[bool] = None
+        self._poll_mode_fails: dict[bool, int] = {False: 0, True: 0}
+
+        # сколько 52B подряд пришло "само" (не в ответ на запись); сбрасывается ответом на запись
+        # и промахом push-ожидания
+        self._push_confidence = 0
+        self._last_write_ts: Optional[float] = None
+
+        # включена ли отбраковка 52B по CRC и счётчики подряд идущих верных/неверных кадров
+        self._crc_enforced = False
+        self._crc_good_run = 0
+        self._crc_bad_run = 0
+        # CRC последнего верного кадра: повтор того же кадра не засчитываем как новое совпадение
+        self._crc_last: Optional[int] = None
 
         self._notify_count = 0
-        self._last_notify_len: Optional[int] = None
+
+        # сколько раз подряд watchdog уже переподключался из-за тишины
+        self._silent_reconnects = 0
+        # когда watchdog последний раз переподписывался/переподключался (тишину меряем и от него)
+        self._silence_action_ts: Optional[float] = None
 
         # timestamps
         self._last_any_notify_ts: Optional[float] = None
@@ -128,54 +264,121 @@ class ProfterHeaterBLE:
     def last(self) -> Parsed:
         return self._last
 
+    @property
+    def is_connected(self) -> bool:
+        return self._client is not None and self._client.is_connected
+
+    def _forget_client(self) -> None:
+        self._client = None
+        key = self._address.upper()
+        if _ACTIVE.get(key) is self:
+            del _ACTIVE[key]
+
     def _now(self) -> float:
-        return asyncio.get_running_loop().time()
+        # loop.time резолвим один раз: HA живёт в одном event loop
+        t = self._time
+        if t is None:
+            t = self._time = asyncio.get_running_loop().time
+        return t()
+
+    def _frame_ok(self, p: bytes | bytearray) -> bool:
+        # Наши POLL52/CMD оканчиваются CRC-16/XMODEM (big-endian) по всем предыдущим байтам.
+        # Не зная точно, держит ли это каждая прошивка, отбраковываем кадры только после
+        # CRC_ENFORCE_AFTER верных подряд и снова пропускаем всё после CRC_RELAX_AFTER неверных.
+        crc = binascii.crc_hqx(memoryview(p)[:-2], 0)
+        if crc == ((p[-2] << 8) | p[-1]):
+            self._crc_bad_run = 0
+            if not self._crc_enforced and crc != self._crc_last:
+                self._crc_good_run += 1
+                if self._crc_good_run >= CRC_ENFORCE_AFTER:
+                    self._crc_enforced = True
+                    _LOGGER.debug("BLE[%s] 52B frames carry CRC -> enforcing", self._address)
+            self._crc_last = crc
+            return True
+
+        self._crc_good_run = 0
+        self._crc_last = None
+        if not self._crc_enforced:
+            return True
+        self._crc_bad_run += 1
+        if self._crc_bad_run >= CRC_RELAX_AFTER:
+            _LOGGER.debug("BLE[%s] %d bad-CRC 52B in a row -> stop enforcing CRC", self._address, self._crc_bad_run)
+            self._crc_enforced = False
+            self._crc_bad_run = 0
+            return True
+        return False
 
     def _notification_cb(self, handle: int, data: bytearray) -> None:
+        # bleak в HA (BlueZ через dbus-fast, ESPHome-прокси) зовёт колбэк в потоке event loop,
+        # поэтому self._last, таймстемпы и future меняем прямо здесь, без call_soon_threadsafe.
+        # исключение из колбэка уходит в диспетчер bleak и может стоить подписки/коннекта
+        try:
+            self._handle_notify(handle, data)
+        except Exception:
+            _LOGGER.exception("BLE[%s] notify callback failed", self._address)
+
+    def _handle_notify(self, handle: int, data: bytearray) -> None:
         self._notify_count += 1
-        b = bytes(data)
-        ln = len(b)
-        self._last_notify_len = ln
+        ln = len(data)
 
         now = self._now()
         self._last_any_notify_ts = now
-        if ln == 52:
+        ok52 = ln == 52 and self._frame_ok(data)
+        if ok52:
             self._last_52_ts = now
-        if ln == 8:
+            wts = self._last_write_ts
+            # считаем только пуши подряд: ответ на нашу запись обнуляет счёт
+            if wts is None or now - wts > self._poll_wait_sec:
+                self._push_confidence += 1
+            else:
+                self._push_confidence = 0
+        elif ln == 8:
             self._last_8_ts = now
 
-        _LOGGER.debug(
-            "BLE[%s] NOTIFY #%d handle=%s len=%d hex=%s",
-            self._address,
-            self._notify_count,
-            handle,
-            ln,
-            _hex(b),
-        )
+        # _hex() считается до проверки уровня логгера — без DEBUG не тратим на него время
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug(
+                "BLE[%s] NOTIFY #%d handle=%s len=%d hex=%s",
+                self._address,
+                self._notify_count,
+                handle,
+                ln,
+                _hex(data, self._hex_limit),
+            )
 
-        if ln == 52:
-            self._parse_52(b, src="notify")
-            self._evt_52.set()
-        else:
+        if ok52:
+            # повтор уже разобранного кадра — парсить нечего (bytearray == bytes сравнивается без копии)
+            if data != self._parsed_raw52:
+                # копию делаем только для 52B — её храним в raw52
+                self._parse_52(bytes(data), src="notify")
+            fut = self._pending_52
+            if fut is not None and not fut.done():
+                fut.set_result(None)
+        elif ln == 52:
+            # битый кадр: линк жив (last_any обновлён), но ни данных, ни ответа на POLL из него нет
+            _LOGGER.debug("BLE[%s] NOTIFY 52 bad CRC -> drop", self._address)
+        elif debug:
             # 8 bytes = idle/ack (у тебя это нормально при выключенном)
             _LOGGER.debug(
                 "BLE[%s] NOTIFY(non-52) (likely idle/ack) len=%d hex=%s",
                 self._address,
                 ln,
-                _hex(b),
+                _hex(data, self._hex_limit),
             )
 
     def _parse_52(self, b: bytes, src: str) -> None:
-        self._last.raw52 = b
-        self._last.is_on = parse_onoff_from_status52(b)
-        self._last.room_c, self._last.heater_c = parse_temps_best_effort(b)
-
-        try:
-            w14 = _u16le(b, 14)
-            w16 = _u16le(b, 16)
-        except Exception:
-            w14 = None
-            w16 = None
+        prev_on = self._last.is_on
+        self._last.raw52 = self._parsed_raw52 = b
+        self._last.is_on = _onoff_52(b)
+        if self._last.is_on != prev_on:
+            self._state_changed.set()
+        # длину (52) уже проверил вызывающий — распаковываем один раз и для температур, и для лога
+        room_raw, heater_raw = _TEMPS.unpack_from(b, 14)
+        self._last.room_c, self._last.heater_c = _temps_from_raw(room_raw, heater_raw)
+
+        if not _LOGGER.isEnabledFor(logging.DEBUG):
+            return
 
         _LOGGER.debug(
             "BLE[%s] PARSE52(%s) on=%s room=%s heater=%s off14_u16=%s off16_u16=%s tail=%s",
@@ -184,36 +387,72 @@ class ProfterHeaterBLE:
             self._last.is_on,
             self._last.room_c,
             self._last.heater_c,
-            w14,
-            w16,
-            _hex(b[-16:]),
+            room_raw & 0xFFFF,
+            heater_raw & 0xFFFF,
+            _hex(memoryview(b)[-16:], self._hex_limit),
         )
 
     async def _wait_ble_device(self, timeout: float = 10.0):
-        end = self._now() + timeout
-        attempt = 0
-        while self._now() < end:
-            attempt += 1
-            ble_device = bluetooth.async_ble_device_from_address(
-                self._hass, self._address, connectable=True
-            )
-            if ble_device is not None:
-                _LOGGER.debug("BLE[%s] Found ble_device attempt=%d: %s", self._address, attempt, ble_device)
-                return ble_device
-            await asyncio.sleep(0.5)
-        raise BleakNotFoundError(f"{DOMAIN}: Device not found (no adv): {self._address}")
+        # устройство уже в кэше HA — ждать нечего
+        ble_device = bluetooth.async_ble_device_from_address(
+            self._hass, self._address, connectable=True
+        )
+        if ble_device is not None:
+            _LOGGER.debug("BLE[%s] Found ble_device (cached): %s", self._address, ble_device)
+            return ble_device
+
+        # иначе подписываемся на advertisement и просыпаемся по первому же пакету
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+
+        @callback
+        def _on_adv(service_info: BluetoothServiceInfoBleak, change: BluetoothChange) -> None:
+            if not fut.done():
+                fut.set_result(service_info.device)
+
+        cancel = bluetooth.async_register_callback(
+            self._hass,
+            _on_adv,
+            BluetoothCallbackMatcher(address=self._address, connectable=True),
+            BluetoothScanningMode.ACTIVE,
+        )
+        try:
+            adv_device = await asyncio.wait_for(fut, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise BleakNotFoundError(f"{DOMAIN}: Device not found (no adv): {self._address}") from None
+        finally:
+            cancel()
+
+        # HA может знать более подходящий (connectable) путь к устройству, чем пришёл в adv
+        ble_device = (
+            bluetooth.async_ble_device_from_address(self._hass, self._address, connectable=True)
+            or adv_device
+        )
+        _LOGGER.debug("BLE[%s] Found ble_device (adv): %s", self._address, ble_device)
+        return ble_device
 
     async def connect(self) -> None:
-        ble_device = await self._wait_ble_device(timeout=10.0)
+        self._time = asyncio.get_running_loop().time
+
+        ble_device = self._ble_device
+        if ble_device is None or self._now() - self._ble_device_ts > BLE_DEVICE_CACHE_SEC:
+            ble_device = self._ble_device = await self._wait_ble_device(timeout=10.0)
+            self._ble_device_ts = self._now()
 
         _LOGGER.debug("BLE[%s] Connecting...", self._address)
-        self._client = await establish_connection(
-            BleakClient,
-            ble_device,
-            self._address,
-            max_attempts=3,
-        )
+        try:
+            self._client = await establish_connection(
+                BleakClient,
+                ble_device,
+                self._address,
+                disconnected_callback=self._on_disconnected,
+                max_attempts=3,
+            )
+        except Exception:
+            # не смогли подключиться — в следующий раз ищем устройство заново
+            self._ble_device = None
+            raise
         _LOGGER.debug("BLE[%s] Connected: is_connected=%s", self._address, self._client.is_connected)
+        _ACTIVE[self._address.upper()] = self
 
         try:
             await self._client.start_notify(NOTIFY_CHAR, self._notification_cb)
@@ -221,7 +460,15 @@ class ProfterHeaterBLE:
         except Exception as e:
             _LOGGER.warning("BLE[%s] start_notify FAILED char=%s err=%s", self._address, NOTIFY_CHAR, e)
 
-        self._evt_52.clear()
+        self._pending_52 = None
+        self._preferred_response = None
+        self._poll_mode_fails = {False: 0, True: 0}
+
+    def _on_disconnected(self, client: BleakClient) -> None:
+        # линк упал сам — забываем клиента, следующий _ensure() подключится и подпишется заново
+        if client is self._client:
+            _LOGGER.debug("BLE[%s] Disconnected by peer/stack", self._address)
+            self._forget_client()
 
     async def disconnect(self) -> None:
         if not self._client:
@@ -235,7 +482,7 @@ class ProfterHeaterBLE:
             await self._client.disconnect()
         except Exception:
             pass
-        self._client = None
+        self._forget_client()
 
     async def _ensure(self) -> BleakClient:
         if self._client and self._client.is_connected:
@@ -249,11 +496,15 @@ class ProfterHeaterBLE:
     async def _try_read_status52(self, c: BleakClient) -> bool:
         # В твоих логах read почти всегда len=0 — оставляем, но не полагаемся.
         try:
+            # bleak всегда отдаёт bytearray — тип не проверяем (иное всё равно упадёт в except ниже)
             b = await c.read_gatt_char(NOTIFY_CHAR)
-            ln = len(b) if isinstance(b, (bytes, bytearray)) else None
-            _LOGGER.debug("BLE[%s] READ char=%s len=%s hex=%s", self._address, NOTIFY_CHAR, ln, _hex(b))
-            if isinstance(b, (bytes, bytearray)) and len(b) == 52:
-                self._parse_52(bytes(b), src="read")
+            ln = len(b)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("BLE[%s] READ char=%s len=%s hex=%s", self._address, NOTIFY_CHAR, ln, _hex(b, self._hex_limit))
+            if ln == 52 and self._frame_ok(b):
+                # тот же кадр, что уже разобран, — только обновляем таймстемпы
+                if b != self._parsed_raw52:
+                    self._parse_52(bytes(b), src="read")
                 now = self._now()
                 self._last_any_notify_ts = now
                 self._last_52_ts = now
@@ -262,83 +513,165 @@ class ProfterHeaterBLE:
             _LOGGER.debug("BLE[%s] READ failed: %s", self._address, e)
         return False
 
+    async def _link_alive(self, c: BleakClient) -> bool:
+        if not c.is_connected:
+            return False
+        try:
+            await asyncio.wait_for(c.read_gatt_char(NOTIFY_CHAR), timeout=LINK_PROBE_TIMEOUT_SEC)
+            return True
+        except Exception as e:
+            _LOGGER.debug("BLE[%s] link probe failed: %s", self._address, e)
+            return False
+
+    async def _resubscribe_notify(self, c: BleakClient) -> None:
+        try:
+            await c.stop_notify(NOTIFY_CHAR)
+        except Exception:
+            pass
+        try:
+            await c.start_notify(NOTIFY_CHAR, self._notification_cb)
+            _LOGGER.debug("BLE[%s] re-subscribed notify char=%s", self._address, NOTIFY_CHAR)
+        except Exception as e:
+            _LOGGER.warning("BLE[%s] re-subscribe notify FAILED char=%s err=%s", self._address, NOTIFY_CHAR, e)
+
     async def _write(self, c: BleakClient, payload: bytes, response: bool, tag: str) -> None:
-        _LOGGER.debug(
-            "BLE[%s] WRITE(%s) char=%s response=%s len=%d hex=%s",
-            self._address,
-            tag,
-            WRITE_CHAR,
-            response,
-            len(payload),
-            _hex(payload),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "BLE[%s] WRITE(%s) char=%s response=%s len=%d hex=%s",
+                self._address,
+                tag,
+                WRITE_CHAR,
+                response,
+                len(payload),
+                _hex(payload, self._hex_limit),
+            )
+        self._last_write_ts = self._now()
         await c.write_gatt_char(WRITE_CHAR, payload, response=response)
 
     async def _poll_for_52(self, c: BleakClient, budget_sec: float) -> bool:
         """
         Пытаемся получить 52B, строго не вылезая за budget_sec.
-        Делаем 2 попытки: noresp, затем resp (если осталось время).
+        Одна запись POLL52 на вызов: режимом, который уже срабатывал на этом коннекте
+        (иначе noresp). На второй режим переходим следующим вызовом, когда текущий
+        набрал на POLL_MODE_SWITCH_MISSES промахов подряд больше второго.
+        Пока ждём notify, параллельно делаем READ: кто первый принёс 52B — тот и выиграл.
         """
-        start = self._now()
+        loop_time = asyncio.get_running_loop().time
+        start = loop_time()
 
         async def _try(resp: bool, tag: str, wait_sec: float) -> bool:
-            self._evt_52.clear()
+            # future создаём до записи, чтобы не пропустить быстрый ответ
+            fut = self._pending_52 = asyncio.get_running_loop().create_future()
             await self._write(c, POLL52, response=resp, tag=tag)
+
+            end = loop_time() + wait_sec
+            read_task = asyncio.ensure_future(self._try_read_status52(c))
+            pending = {fut, read_task}
             try:
-                await asyncio.wait_for(self._evt_52.wait(), timeout=wait_sec)
-                return True
-            except asyncio.TimeoutError:
+                while pending:
+                    left = end - loop_time()
+                    if left <= 0:
+                        break
+                    done, pending = await asyncio.wait(pending, timeout=left, return_when=asyncio.FIRST_COMPLETED)
+                    if fut in done:
+                        return True
+                    if read_task in done and read_task.result():
+                        return True
                 return False
+            finally:
+                # сам future не отменяем: запоздавший notify ещё может его резолвить (см. poll_status)
+                if not read_task.done():
+                    read_task.cancel()
 
-        # noresp
-        left = budget_sec - (self._now() - start)
+        fails = self._poll_mode_fails
+        resp = self._preferred_response if self._preferred_response is not None else False
+        if fails[resp] - fails[not resp] >= POLL_MODE_SWITCH_MISSES:
+            resp = not resp
+
+        left = budget_sec - (loop_time() - start)
         if left <= 0:
             return False
-        if await _try(False, "POLL52(noresp)", wait_sec=min(0.9, left)):
+
+        tag = "POLL52(resp)" if resp else "POLL52(noresp)"
+        if await _try(resp, tag, wait_sec=min(self._poll_wait_sec, left)):
+            fails[resp] = 0
+            self._preferred_response = resp
             return True
 
-        # resp
-        left = budget_sec - (self._now() - start)
-        if left <= 0:
-            return False
-        return await _try(True, "POLL52(resp)", wait_sec=min(0.9, left))
+        fails[resp] += 1
+        return False
 
     def _recent_idle_notify(self, since_ts: float, window_sec: float) -> bool:
         return bool(self._last_8_ts is not None and (self._last_8_ts >= since_ts) and (self._now() - self._last_8_ts) <= window_sec)
 
-    async def poll_status(self, timeout: float = 6.0) -> Parsed:
+    async def poll_status(self, timeout: float = 6.0, fresh_sec: float = 0.0) -> Parsed:
+        # если опрос уже идёт — присоединяемся к нему, а не ставим второй в очередь на lock
+        inflight = self._inflight_poll
+        if inflight is not None:
+            _LOGGER.debug("BLE[%s] poll_status() join in-flight poll", self._address)
+            return await asyncio.shield(inflight)
+
+        fut = self._inflight_poll = asyncio.get_running_loop().create_future()
+        try:
+            return await self._poll_status(timeout, fresh_sec)
+        finally:
+            # присоединившиеся получают актуальный last даже если у владельца опроса ошибка
+            if not fut.done():
+                fut.set_result(self._last)
+            self._inflight_poll = None
+
+    async def _poll_status(self, timeout: float, fresh_sec: float) -> Parsed:
         async with self._lock:
-            t0 = self._now()
+            loop_time = asyncio.get_running_loop().time
+            t0 = loop_time()
             deadline = t0 + timeout
             poll_started = t0
 
-            c = await self._ensure()
-
-            def _ago(ts: Optional[float]) -> float:
-                return (t0 - ts) if ts else -1.0
+            # 0) устройство само прислало 52B достаточно недавно — BLE не трогаем вовсе
+            if self._last.raw52 is not None and self._last_52_ts is not None and t0 - self._last_52_ts < fresh_sec:
+                _LOGGER.debug(
+                    "BLE[%s] poll_status() fresh 52 from notify (%.2fs < %.2fs) -> return last",
+                    self._address,
+                    t0 - self._last_52_ts,
+                    fresh_sec,
+                )
+                return self._last
 
-            _LOGGER.debug(
-                "BLE[%s] poll_status() begin timeout=%.2f last(on=%s room=%s heater=%s) "
-                "last_any=%.1fs last_52=%.1fs last_8=%.1fs",
-                self._address,
-                timeout,
-                self._last.is_on,
-                self._last.room_c,
-                self._last.heater_c,
-                _ago(self._last_any_notify_ts),
-                _ago(self._last_52_ts),
-                _ago(self._last_8_ts),
-            )
+            c = await self._ensure()
 
-            # 1) Быстрый read (редко помогает, но дешево)
-            if self._now() < deadline:
-                if await self._try_read_status52(c):
-                    _LOGGER.debug("BLE[%s] poll_status() got 52 via READ in %.3fs", self._address, self._now() - t0)
+            # 0.5) устройство пушит само — ждём следующий кадр без записи; промах -> обратно на POLL
+            if self._push_confidence >= PUSH_MODE_MIN_CONFIDENCE:
+                fut = self._pending_52 = asyncio.get_running_loop().create_future()
+                try:
+                    await asyncio.wait_for(fut, timeout=timeout * PUSH_WAIT_FRACTION)
+                    _LOGGER.debug("BLE[%s] poll_status() got pushed 52 in %.3fs", self._address, loop_time() - t0)
                     return self._last
-
-            # 2) POLL с жёстким бюджетом времени
-            for attempt in range(1, 4):
-                now = self._now()
+                except asyncio.TimeoutError:
+                    _LOGGER.debug("BLE[%s] poll_status() no push in %.2fs -> back to POLL", self._address, loop_time() - t0)
+                    self._push_confidence = 0
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+
+                def _ago(ts: Optional[float]) -> float:
+                    return (t0 - ts) if ts else -1.0
+
+                _LOGGER.debug(
+                    "BLE[%s] poll_status() begin timeout=%.2f last(on=%s room=%s heater=%s) "
+                    "last_any=%.1fs last_52=%.1fs last_8=%.1fs",
+                    self._address,
+                    timeout,
+                    self._last.is_on,
+                    self._last.room_c,
+                    self._last.heater_c,
+                    _ago(self._last_any_notify_ts),
+                    _ago(self._last_52_ts),
+                    _ago(self._last_8_ts),
+                )
+
+            # 1) POLL с жёстким бюджетом времени (READ идёт параллельно внутри _poll_for_52)
+            last_attempt = len(POLL_ATTEMPT_SLICES_SEC)
+            for attempt, slice_sec in enumerate(POLL_ATTEMPT_SLICES_SEC, 1):
+                now = loop_time()
                 remaining = deadline - now
                 if remaining <= 0:
                     break
@@ -353,7 +686,7 @@ class ProfterHeaterBLE:
                     )
                     return self._last
 
-                budget = min(1.8, remaining)  # на одну попытку не тратим больше ~1.8с
+                budget = min(slice_sec, remaining)
                 got52 = False
                 try:
                     got52 = await self._poll_for_52(c, budget_sec=budget)
@@ -373,7 +706,7 @@ class ProfterHeaterBLE:
                         "BLE[%s] poll_status() got 52 attempt=%d in %.3fs",
                         self._address,
                         attempt,
-                        self._now() - t0,
+                        loop_time() - t0,
                     )
                     return self._last
 
@@ -386,44 +719,76 @@ class ProfterHeaterBLE:
                     )
                     return self._last
 
-                # optional: read, но только если ещё есть время
-                if self._now() < deadline:
-                    if await self._try_read_status52(c):
-                        _LOGGER.debug("BLE[%s] poll_status() got 52 via READ(after POLL) in %.3fs", self._address, self._now() - t0)
-                        return self._last
-
-                _LOGGER.debug("BLE[%s] poll_status() no 52 attempt=%d (elapsed=%.3fs)", self._address, attempt, self._now() - t0)
+                _LOGGER.debug("BLE[%s] poll_status() no 52 attempt=%d (elapsed=%.3fs)", self._address, attempt, loop_time() - t0)
 
-                # короткая пауза, но строго по бюджету
-                if self._now() + 0.15 < deadline:
-                    await asyncio.sleep(0.15)
+                # между попытками — короткий растущий backoff; после последней — не ждём вовсе
+                if attempt < last_attempt:
+                    await asyncio.sleep(max(0.0, min(POLL_RETRY_BACKOFF_SEC * 2 ** (attempt - 1), deadline - loop_time())))
+                    # запоздавший 52B (после таймаута попытки) уже разобран — не шлём ради него новый POLL
+                    fut = self._pending_52
+                    if fut is not None and fut.done():
+                        _LOGGER.debug("BLE[%s] poll_status() late 52 after attempt=%d -> return last", self._address, attempt)
+                        return self._last
 
-            # 3) reconnect только если реально “тишина” по notify слишком долго
-            now = self._now()
-            if self._last_any_notify_ts is not None:
-                silent_for = now - self._last_any_notify_ts
-                if silent_for > NO_NOTIFY_RECONNECT_SEC:
-                    _LOGGER.warning("BLE[%s] No any notify for %.1fs -> reconnect", self._address, silent_for)
-                    await self.disconnect()
-                    await self._ensure()
+            # 2) reconnect только если реально “тишина” по notify слишком долго
+            now = loop_time()
+            last_notify = self._last_any_notify_ts
+            if last_notify is not None:
+                action_ts = self._silence_action_ts
+                if action_ts is not None and last_notify > action_ts:
+                    # после нашей переподписки/reconnect notify вернулись — backoff с нуля
+                    self._silent_reconnects = 0
+                    action_ts = self._silence_action_ts = None
+                # порог отсчитываем от последнего события: notify или нашего действия
+                since = now - (action_ts if action_ts is not None else last_notify)
+                threshold = self._no_notify_reconnect_sec * (2 ** min(self._silent_reconnects, NO_NOTIFY_BACKOFF_MAX_POW))
+                if since > threshold:
+                    silent_for = now - last_notify
+                    self._silent_reconnects += 1
+                    if await self._link_alive(c):
+                        # линк живой, молчит только подписка — переподписываемся вместо полного reconnect
+                        _LOGGER.warning("BLE[%s] No any notify for %.1fs, link alive -> resubscribe", self._address, silent_for)
+                        await self._resubscribe_notify(c)
+                    else:
+                        _LOGGER.warning("BLE[%s] No any notify for %.1fs -> reconnect", self._address, silent_for)
+                        await self.disconnect()
+                        await self._ensure()
+                    self._silence_action_ts = loop_time()
             else:
                 # если вообще никогда не было notify — не дергаем reconnect тут,
                 # это может быть первый цикл сразу после старта
                 pass
 
-            _LOGGER.debug("BLE[%s] poll_status() end NO-52 in %.3fs -> return last", self._address, self._now() - t0)
+            _LOGGER.debug("BLE[%s] poll_status() end NO-52 in %.3fs -> return last", self._address, loop_time() - t0)
             return self._last
 
     async def set_on(self, on: bool, timeout: float = 6.0) -> Parsed:
         async with self._lock:
-            t0 = self._now()
+            loop_time = asyncio.get_running_loop().time
+            t0 = loop_time()
             deadline = t0 + timeout
-            cmd = CMD_ON if on else CMD_OFF
+            cmd = _CMDS[on]
+
+            # доверяем только is_on, разобранному из кадра (не оптимистичному от прошлого set_on)
+            if (
+                self._last.is_on == on
+                and self._parsed_raw52 is not None
+                and self._last_52_ts is not None
+                and t0 - self._last_52_ts < ALREADY_IN_STATE_FRESH_SEC
+            ):
+                _LOGGER.debug(
+                    "BLE[%s] set_on(%s) already in state (last_52=%.2fs ago) -> skip CMD",
+                    self._address,
+                    on,
+                    t0 - self._last_52_ts,
+                )
+                return self._last
 
             c = await self._ensure()
 
             _LOGGER.debug("BLE[%s] set_on(%s) begin timeout=%.2f", self._address, on, timeout)
 
+            self._state_changed.clear()
             try:
                 await self._write(c, cmd, response=True, tag="CMD")
             except Exception as e:
@@ -432,27 +797,42 @@ class ProfterHeaterBLE:
                 c = await self._ensure()
                 await self._write(c, cmd, response=True, tag="CMD(retry)")
 
-            # маленькая пауза, но не вылезаем за deadline
-            if self._now() + 0.25 < deadline:
-                await asyncio.sleep(0.25)
+            # self._last — один и тот же объект (его мутирует _parse_52), держим локальную ссылку
+            last = self._last
+            state_changed = self._state_changed
+            while loop_time() < deadline:
+                state_changed.clear()
 
-            while self._now() < deadline:
                 # если уже совпало — выходим
-                if self._last.is_on is not None and self._last.is_on == on:
+                if last.is_on == on:
                     _LOGGER.debug("BLE[%s] set_on(%s) already matched state", self._address, on)
-                    return self._last
+                    return last
 
                 # особый кейс: после выключения устройство может перейти в idle и слать только 8 байт
-                if on is False and self._last_8_ts and (self._now() - self._last_8_ts) <= IDLE_AFTER_OFF_CONFIRM_SEC:
+                if on is False and self._last_8_ts and (loop_time() - self._last_8_ts) <= IDLE_AFTER_OFF_CONFIRM_SEC:
                     _LOGGER.debug(
                         "BLE[%s] set_on(False) treating recent idle(8B) notify as confirmation (last8=%.2fs ago)",
                         self._address,
-                        self._now() - self._last_8_ts,
+                        loop_time() - self._last_8_ts,
                     )
-                    self._last.is_on = False
-                    return self._last
+                    last.is_on = False
+                    self._parsed_raw52 = None
+                    return last
+
+                remaining = deadline - loop_time()
+                if remaining <= 0:
+                    break
 
-                remaining = deadline - self._now()
+                # сначала ждём notify со сменой состояния (вместо слепого sleep)
+                try:
+                    await asyncio.wait_for(
+                        state_changed.wait(), timeout=min(STATE_CHANGE_WAIT_SEC, remaining)
+                    )
+                    continue
+                except asyncio.TimeoutError:
+                    pass
+
+                remaining = deadline - loop_time()
                 if remaining <= 0:
                     break
 
@@ -460,32 +840,22 @@ class ProfterHeaterBLE:
                 budget = min(1.2, remaining)
                 try:
                     ok = await self._poll_for_52(c, budget_sec=budget)
-                    if ok and self._last.is_on is not None and self._last.is_on == on:
-                        _LOGGER.debug("BLE[%s] set_on(%s) confirmed via 52 in %.3fs", self._address, on, self._now() - t0)
-                        return self._last
+                    if ok and last.is_on == on:
+                        _LOGGER.debug("BLE[%s] set_on(%s) confirmed via 52 in %.3fs", self._address, on, loop_time() - t0)
+                        return last
                 except Exception as e:
                     _LOGGER.debug("BLE[%s] set_on(%s) poll error: %s -> reconnect", self._address, on, e)
                     await self.disconnect()
                     c = await self._ensure()
 
-                # read только если успеваем
-                if self._now() < deadline:
-                    if await self._try_read_status52(c):
-                        if self._last.is_on is not None and self._last.is_on == on:
-                            _LOGGER.debug("BLE[%s] set_on(%s) confirmed via READ in %.3fs", self._address, on, self._now() - t0)
-                            return self._last
-
-                # короткая пауза по бюджету
-                if self._now() + 0.15 < deadline:
-                    await asyncio.sleep(0.15)
-
             _LOGGER.warning(
                 "BLE[%s] set_on(%s) NOT CONFIRMED in %.3fs -> optimistic is_on=%s (last was %s)",
                 self._address,
                 on,
-                self._now() - t0,
+                loop_time() - t0,
                 on,
-                self._last.is_on,
+                last.is_on,
             )
-            self._last.is_on = on
-            return self._last
\ No newline at end of file
+            last.is_on = on
+            self._parsed_raw52 = None
+            return last
\ No newline at end of file
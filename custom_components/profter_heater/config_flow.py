@@ -31,7 +31,10 @@ class ProfterHeaterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         schema = vol.Schema(
             {
                 vol.Required(CONF_ADDRESS): selector.TextSelector(),
-                vol.Optional(CONF_POLL_INTERVAL, default=DEFAULT_POLL_INTERVAL): vol.Coerce(int),
+                # 0/отрицательный интервал — coordinator крутится вхолостую и забивает радио
+                vol.Optional(CONF_POLL_INTERVAL, default=DEFAULT_POLL_INTERVAL): vol.All(
+                    vol.Coerce(int), vol.Range(min=5, max=3600)
+                ),
             }
         )
 
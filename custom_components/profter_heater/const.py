@@ -7,6 +7,11 @@ CONF_POLL_INTERVAL = "poll_interval"
 
 DEFAULT_POLL_INTERVAL = 10  # seconds
 
+# Тонкая настройка BLE (entry.options); дефолты — в ble.py
+CONF_POLL_WAIT = "poll_wait"
+CONF_NO_NOTIFY_RECONNECT = "no_notify_reconnect"
+CONF_HEX_LOG_LIMIT = "hex_log_limit"
+
 # GATT UUIDs
 WRITE_CHAR  = "00003a01-0000-1000-8000-00805f9b34fb"
 NOTIFY_CHAR = "00003a00-0000-1000-8000-00805f9b34fb"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import timedelta
 import logging
 import time
@@ -16,6 +17,13 @@ _LOGGER = logging.getLogger(__name__)
 # BLE-реальность: опрашивать чаще 15 сек обычно вредно
 MIN_EFFECTIVE_POLL_SECONDS = 15
 
+# Если 52B-кадр пришёл сам (notify) не раньше этой доли интервала опроса — POLL не шлём
+FRESH_STATUS_FRACTION = 0.8
+
+# После команды состояние (розжиг/остывание) вероятнее всего меняется в первые секунды:
+# опрашиваем гуще сразу, потом всё реже (4 опроса на ~60с), затем обычный интервал.
+POST_COMMAND_POLL_DELAYS = (4, 8, 16, 32)  # seconds between polls
+
 
 class ProfterHeaterCoordinator(DataUpdateCoordinator[Parsed]):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -33,22 +41,31 @@ class ProfterHeaterCoordinator(DataUpdateCoordinator[Parsed]):
         # но реальный BLE-запрос будем ограничивать MIN_EFFECTIVE_POLL_SECONDS.
         self._configured_poll = poll
         self._last_ble_poll_monotonic: float = 0.0
+        # оставшиеся шаги плотного расписания после async_set_power
+        self._post_command_delays: list[int] = []
 
-        self.ble = ProfterHeaterBLE(hass, self.address)
+        self.ble = ProfterHeaterBLE(hass, self.address, entry.options)
 
         super().__init__(
             hass,
             logger=_LOGGER,
             name=f"{DOMAIN}_{self.address}",
             update_interval=timedelta(seconds=poll),
+            # слушатели (4 сенсора + switch) будятся только когда кадр реально поменялся
+            always_update=False,
         )
 
     async def _async_update_data(self) -> Parsed:
         now = time.monotonic()
         since = now - self._last_ble_poll_monotonic
 
+        # следующий тик: очередной шаг после-командного расписания или обычный интервал
+        delay = self._post_command_delays.pop(0) if self._post_command_delays else None
+        self.update_interval = timedelta(seconds=delay if delay is not None else self._configured_poll)
+
         # если тик пришёл слишком рано — не трогаем BLE, отдаём последнее
-        if self._last_ble_poll_monotonic and since < MIN_EFFECTIVE_POLL_SECONDS:
+        # (плотные тики после команды — намеренные, их не режем)
+        if delay is None and self._last_ble_poll_monotonic and since < MIN_EFFECTIVE_POLL_SECONDS:
             _LOGGER.debug(
                 "TICK skip BLE poll (%ss < %ss) %s",
                 round(since, 2),
@@ -57,12 +74,19 @@ class ProfterHeaterCoordinator(DataUpdateCoordinator[Parsed]):
             )
             # coordinator.data может быть None на старте — тогда пусть всё же попробует BLE
             if self.data is not None:
-                return self.data
+                # свежий снимок: кадры, пришедшие notify после прошлого опроса, тоже публикуем
+                return replace(self.ble.last)
 
         _LOGGER.debug("TICK poll_status() %s (configured=%ss)", self.address, self._configured_poll)
 
         try:
-            data = await self.ble.poll_status(timeout=6.0)
+            # на плотном тике свежесть меряем по прошедшему интервалу, а не по следующему
+            # (он вдвое длиннее — иначе кадр прошлого тика всегда казался бы свежим)
+            interval = since if delay is not None else max(self._configured_poll, MIN_EFFECTIVE_POLL_SECONDS)
+            fresh_sec = interval * FRESH_STATUS_FRACTION
+            # ble.last мутируется на месте — отдаём снимок, иначе always_update=False
+            # сравнивал бы объект сам с собой и не видел изменений
+            data = replace(await self.ble.poll_status(timeout=6.0, fresh_sec=fresh_sec))
             self._last_ble_poll_monotonic = time.monotonic()
 
             _LOGGER.debug(
@@ -83,4 +107,10 @@ class ProfterHeaterCoordinator(DataUpdateCoordinator[Parsed]):
         # после команды считаем, что “свежее” уже получали/пытались получить
         self._last_ble_poll_monotonic = time.monotonic()
 
-        await self.async_request_refresh()
\ No newline at end of file
+        # состояние, подтверждённое set_on, публикуем сразу, без повторного POLL;
+        # плотное расписание начинается со следующего тика (async_set_updated_data
+        # перепланирует его по update_interval)
+        first, *rest = POST_COMMAND_POLL_DELAYS
+        self._post_command_delays = rest
+        self.update_interval = timedelta(seconds=first)
+        self.async_set_updated_data(replace(self.ble.last))
\ No newline at end of file